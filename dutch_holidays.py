@@ -1,48 +1,52 @@
-def check_if_holiday(hour):
-    # Holidays derived from https://www.officeholidays.com/countries/netherlands/2018
-
-    # Monday January 1st: New Year's Day
-    if hour >= 0 and hour < 24:
-        return True
-
-    # Friday March 30st: Good Friday
-    if hour >= 2112 and hour < 2112 + 24:
-        return True
-
-    # Sunday April 1st: Easter Day
-    if hour >= 2160 and hour < 2160 + 24:
-        return True
-
-    # Monday April 2nd: Easter Monday
-    if hour >= 2184 and hour < 2184 + 24:
-        return True
-
-    # Friday April 27th: Kingsday
-    if hour >= 2784 and hour < 2784 + 24:
-        return True
+import math
+import numpy as np
+
+# Holidays derived from https://www.officeholidays.com/countries/netherlands/2018
+# Each entry is the first simulation hour of a holiday; every holiday lasts 24 hours,
+# starting at midnight.
+HOLIDAY_START_HOURS = (
+    0,  # Monday January 1st: New Year's Day
+    2112,  # Friday March 30st: Good Friday
+    2160,  # Sunday April 1st: Easter Day
+    2184,  # Monday April 2nd: Easter Monday
+    2784,  # Friday April 27th: Kingsday
+    2976,  # Saturday May 5th: Liberation Day
+    3096,  # Thursday May 10: Ascension Day
+    3336,  # Sunday May 20: Pentecost Sunday
+    3360,  # Monday May 21: Whit Monday
+    8592,  # Tuesday December 25th: Christmas Day 1
+    8616,  # Thursday December 26th: Christmas Day 2
+)
+
+# Every hour of the simulated year that falls on a holiday, built once at import so that
+# check_if_holiday is a single set lookup instead of a chain of range checks. Floats with a
+# whole value hash like the equal int, so simulation times such as 2112.0 are found as well.
+HOLIDAY_HOURS = frozenset(
+    hour
+    for start_hour in HOLIDAY_START_HOURS
+    for hour in range(start_hour, start_hour + 24)
+)
+
+# The same holidays with one entry per day of the simulated year, for vectorized lookups
+HOLIDAY_DAYS = bytearray(365)
+for _start_hour in HOLIDAY_START_HOURS:
+    HOLIDAY_DAYS[_start_hour // 24] = 1
 
-    # Saturday May 5th: Liberation Day
-    if hour >= 2976 and hour < 2975 + 24:
-        return True
 
-    # Thursday May 10: Ascension Day
-    if hour >= 3096 and hour < 3096 + 24:
-        return True
-
-    # Sunday May 20: Pentecost Sunday
-    if hour >= 3336 and hour < 3336 + 24:
-        return True
-
-    # Monday May 21: Whit Monday
-    if hour >= 3360 and hour < 3360 + 24:
-        return True
-
-    # Tuesday December 25th: Christmas Day 1
-    if hour >= 8592 and hour < 8592 + 24:
-        return True
-
-    # Thursday December 26th: Christmas Day 2
-    if hour >= 8616 and hour < 8616 + 24:
-        return True
-
-    return False
+def check_if_holiday(hour):
+    # A fractional hour (of any float type, including NumPy floats) is a holiday if the whole
+    # hour it falls in is one. Hours outside of the simulated year are never in
+    # HOLIDAY_HOURS, so they need no separate check.
+    return hour in HOLIDAY_HOURS or (
+        not isinstance(hour, int) and math.floor(hour) in HOLIDAY_HOURS
+    )
+
+
+def check_if_holiday_batch(hours):
+    # Vectorized check_if_holiday: returns a boolean array with the holiday status of every hour
+    hours = np.asarray(hours)
+    in_year = (hours >= 0) & (hours < len(HOLIDAY_DAYS) * 24)
+    is_holiday = np.zeros(hours.shape, dtype=bool)
+    days = (hours[in_year] // 24).astype(np.intp)
+    is_holiday[in_year] = np.frombuffer(HOLIDAY_DAYS, dtype=np.uint8)[days] == 1
+    return is_holiday
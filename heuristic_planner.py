@@ -10,14 +10,78 @@ The planner aims to reduce waiting times, nervousness, and costs while maintaini
 service quality in a healthcare setting.
 """
 
-from math import floor
+import math
 from simulator import Simulator
 from planners import Planner
 from problems import HealthcareProblem, ResourceType
 from reporter import EventLogReporter, ResourceScheduleReporter
+from dutch_holidays import check_if_holiday
 from resource_logistics import *
 from enum import Enum
+import numpy as np
 import os
+import sys
+import time
+import uuid
+
+# Numba is optional, without it the NumPy implementation below is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    # With Numba the scan is compiled to machine code, so a plain loop that stops at the
+    # first hit is faster than building a boolean mask. cache=True stores the compiled
+    # function on disk so that later runs (and worker processes) skip the compilation.
+    @njit(cache=True)
+    def _first_available_hour(planned_intakers, first_hour, last_hour):
+        """
+        Find the first hour in [first_hour, last_hour] at which an intaker is still available.
+
+        Parameters:
+            planned_intakers (np.ndarray): Number of available intakers per (simulation) hour
+            first_hour (int): First hour that may be planned
+            last_hour (int): Last hour that may be planned
+
+        Returns:
+            int: The first hour with an available intaker, or -1 if there is none
+        """
+        for hour in range(first_hour, min(last_hour + 1, len(planned_intakers))):
+            if planned_intakers[hour] > 0:
+                return hour
+        return -1
+
+else:
+
+    def _first_available_hour(planned_intakers, first_hour, last_hour):
+        """
+        Find the first hour in [first_hour, last_hour] at which an intaker is still available.
+
+        Without Numba the whole window is compared against zero in one NumPy operation.
+
+        Parameters:
+            planned_intakers (np.ndarray): Number of available intakers per (simulation) hour
+            first_hour (int): First hour that may be planned
+            last_hour (int): Last hour that may be planned
+
+        Returns:
+            int: The first hour with an available intaker, or -1 if there is none
+        """
+        available = planned_intakers[first_hour : last_hour + 1] > 0
+        if not available.any():
+            return -1
+        return first_hour + int(available.argmax())
+
+
+def warm_up():
+    """
+    Compile (or load from Numba's on-disk cache) the intake slot search ahead of time, so
+    that the first call to HeuristicPlanner.plan during a simulation does not pay for it.
+    Without Numba this is a cheap call to the NumPy implementation.
+    """
+    _first_available_hour(np.full(1, 4, dtype=np.int32), 0, 0)
 
 
 class Weekday(Enum):
@@ -39,6 +103,12 @@ class Weekday(Enum):
         return self.name.capitalize()
 
 
+# Day names indexed by day of the week, so the scheduler does not have to construct
+# a Weekday for every scheduled day. The names are built at runtime, so they are interned
+# explicitly to let lookups in the schedule tables match keys by identity.
+WEEKDAY_NAMES = tuple(sys.intern(str(day)) for day in Weekday)
+
+
 class HeuristicPlanner(Planner):
     """
     A heuristic-based planner for optimizing healthcare resource allocation and patient scheduling.
@@ -53,7 +123,14 @@ class HeuristicPlanner(Planner):
     like advance notice requirements and resource availability.
     """
 
-    def __init__(self, eventlog_file, data_columns, weekly_res_schedule):
+    def __init__(
+        self,
+        eventlog_file,
+        data_columns,
+        weekly_res_schedule,
+        enable_eventlog=True,
+        enable_resource_reporter=True,
+    ):
         """
         Initialize the HeuristicPlanner with event logging and resource scheduling capabilities.
 
@@ -61,23 +138,84 @@ class HeuristicPlanner(Planner):
             eventlog_file (str): Path to file where event logs will be stored
             data_columns (list): Additional data columns to track in event logs
             weekly_res_schedule (dict): Weekly schedule of resource availability
+            enable_eventlog (bool): Whether events are written to the event log
+            enable_resource_reporter (bool): Whether resource usage is recorded for visualization
         """
         super().__init__()
-        self.eventlog_reporter = EventLogReporter(eventlog_file, data_columns)
-        self.resource_reporter = ResourceScheduleReporter()
+        # Reporters that are disabled are set to None and skipped in report()
+        self.eventlog_reporter = (
+            EventLogReporter(eventlog_file, data_columns) if enable_eventlog else None
+        )
+        self.resource_reporter = (
+            ResourceScheduleReporter() if enable_resource_reporter else None
+        )
         self.replanned_patients = (
             set()
         )  # Track patients whose appointments were rescheduled
         # Initialize availability tracker for intake resources (default: 4 intakers per hour)
-        self.planned_intakers = [
-            4
-        ] * 10000  # List that tracks how many intakers are available per (simulation) hour
+        self.planned_intakers = np.full(
+            10000, 4, dtype=np.int32
+        )  # Array that tracks how many intakers are available per (simulation) hour
+        # View on the same buffer for reading and updating single hours: indexing a
+        # memoryview returns a plain int instead of a NumPy scalar
+        self.planned_intakers_view = memoryview(self.planned_intakers)
         self.not_planned_within_week_counter = (
             0  # Count cases that couldn't be scheduled within a week
         )
-        self.weekly_resource_schedule = (
-            weekly_res_schedule  # Store the weekly resource schedule
-        )
+        # Store the weekly resource schedule, which also builds the slot resources from it
+        self.weekly_resource_schedule = weekly_res_schedule
+
+    @property
+    def weekly_resource_schedule(self):
+        """The weekly schedule of resource availability that the planner schedules from."""
+        return self._weekly_resource_schedule
+
+    @weekly_resource_schedule.setter
+    def weekly_resource_schedule(self, weekly_res_schedule):
+        """
+        Set the weekly resource schedule and rebuild the slot resources from it.
+
+        The slot resources hold the (resource_type, count) pairs to schedule for every
+        (weekday, hour of day, holiday) combination. They are a snapshot of the schedule at
+        the time it is set, so a schedule that is changed in place must be assigned again
+        for the changes to take effect.
+
+        Parameters:
+            weekly_res_schedule (dict): Weekly schedule of resource availability
+        """
+        self._weekly_resource_schedule = weekly_res_schedule
+        self.slot_resources = {
+            key: tuple(scheduled.items())
+            for key, scheduled in build_schedule_table(weekly_res_schedule).items()
+        }
+
+    def reset(self, eventlog_file=None):
+        """
+        Reset the planning state so that the planner can be reused for another simulation.
+
+        The intaker availability buffer is refilled in place instead of being reallocated, and
+        the slot resources are kept because they only depend on the weekly schedule.
+        The reporters (if enabled) start over. Every simulation numbers its cases from 0, so
+        the event log of the next simulation must go to a new file.
+
+        Parameters:
+            eventlog_file (str, optional): Path to the event log of the next simulation.
+                Required if the event log is enabled.
+        """
+        if self.eventlog_reporter is not None:
+            if eventlog_file is None:
+                raise ValueError(
+                    "reset needs a new eventlog_file while the event log is enabled"
+                )
+            self.eventlog_reporter.close()
+            self.eventlog_reporter = EventLogReporter(
+                eventlog_file, self.eventlog_reporter.data_types
+            )
+        self.planned_intakers.fill(4)
+        self.replanned_patients.clear()
+        self.not_planned_within_week_counter = 0
+        if self.resource_reporter is not None:
+            self.resource_reporter = ResourceScheduleReporter()
 
     def update_intaker_schedule(self, scheduled_resources):
         """
@@ -97,24 +235,43 @@ class HeuristicPlanner(Planner):
 
         # Update the availability for each time slot:
         # Morning (8-12): 4 hours
-        for i in range(4):
-            self.planned_intakers[scheduled_intakes[0][1] + i] = scheduled_intakes[0][2]
+        start = scheduled_intakes[0][1]
+        self.planned_intakers[start : start + 4] = scheduled_intakes[0][2]
         # Afternoon (12-18): 6 hours
-        for i in range(6):
-            self.planned_intakers[scheduled_intakes[1][1] + i] = scheduled_intakes[1][2]
+        start = scheduled_intakes[1][1]
+        self.planned_intakers[start : start + 6] = scheduled_intakes[1][2]
         # Evening (18-1): 7 hours
-        for i in range(7):
-            self.planned_intakers[scheduled_intakes[2][1] + i] = scheduled_intakes[2][2]
+        start = scheduled_intakes[2][1]
+        self.planned_intakers[start : start + 7] = scheduled_intakes[2][2]
         # Night (1-8): 7 hours
-        for i in range(7):
-            self.planned_intakers[scheduled_intakes[3][1] + i] = scheduled_intakes[3][2]
+        start = scheduled_intakes[3][1]
+        self.planned_intakers[start : start + 7] = scheduled_intakes[3][2]
+
+    def get_slot_resources(self, week_day, start_time):
+        """
+        Get the resources to schedule for the time slot starting at start_time.
+
+        The weekly resource schedule is static, so the outcome only depends on the weekday,
+        the hour of the day and whether start_time falls on a holiday. It is looked up in
+        the table that was built when the planner was created.
+
+        Parameters:
+            week_day (str): Day of the week (e.g., "Monday", "Tuesday")
+            start_time (int): Simulation hour at which the time slot starts
+
+        Returns:
+            tuple: Tuple of tuples in format (resource_type, count)
+        """
+        return self.slot_resources[
+            (week_day, start_time % 24, check_if_holiday(start_time))
+        ]
 
     def report(self, case_id, element, timestamp, resource, lifecycle_state, data=None):
         """
         Record simulation events for later analysis and visualization.
 
         Each time a simulation event happens, this method is invoked to log the event
-        to both the event log reporter and resource schedule reporter.
+        to the event log reporter and resource schedule reporter (if they are enabled).
 
         Parameters:
             case_id (str): The case ID of the patient to which the event applies
@@ -124,12 +281,14 @@ class HeuristicPlanner(Planner):
             lifecycle_state (str): The lifecycle state of the element ("start", "complete")
             data (dict, optional): Dictionary with additional data for the event
         """
-        self.eventlog_reporter.callback(
-            case_id, element, timestamp, resource, lifecycle_state
-        )
-        self.resource_reporter.callback(
-            case_id, element, timestamp, resource, lifecycle_state, data
-        )
+        if self.eventlog_reporter is not None:
+            self.eventlog_reporter.callback(
+                case_id, element, timestamp, resource, lifecycle_state
+            )
+        if self.resource_reporter is not None:
+            self.resource_reporter.callback(
+                case_id, element, timestamp, resource, lifecycle_state, data
+            )
 
     def plan(self, cases_to_plan, _, simulation_time):
         """
@@ -151,33 +310,35 @@ class HeuristicPlanner(Planner):
         """
         planned_cases = []
 
-        break_loops = False
+        # Candidate hours run from 24 hours ahead (minimum required planning horizon)
+        # up to and including a week (168 hours) + 1 hour ahead
+        current_hour = math.ceil(simulation_time)
+        first_hour = current_hour + 24
+        last_hour = current_hour + 169
         for case_id in cases_to_plan:
-            i = 24  # Start looking 24 hours ahead (minimum required planning horizon)
-            time_slot_found = False
-            # Look for the first available INTAKE resource and plan the first case
-            while not time_slot_found:
-                # Check if an intaker is available at this time slot
-                if self.planned_intakers[math.ceil(simulation_time) + i] > 0:
-                    next_plannable_time = math.ceil(simulation_time) + i
-                    planned_cases.append((case_id, next_plannable_time))
-                    # Decrease the available intakers at this time slot
-                    self.planned_intakers[floor(simulation_time) + i] -= 1
-                    time_slot_found = True
-                # If we've checked a week ahead and found no slots: plan this patient later, because we haven't scheduled the intakers yet.
-                elif i > 168:  # 168 hours = 1 week
-                    self.not_planned_within_week_counter += 1
-                    # Break both the while loop and the for loop
-                    break_loops = True
-                    break
-
-                i += 1  # Look at the next hour
-
-            # If we couldn't find a slot within a week for one patient,
-            # stop planning altogether to avoid excessive computation
-            if break_loops:
+            # Look for the first available INTAKE resource in the planning window
+            # Usually the first candidate hour still has an intaker, so check it directly
+            # before scanning the rest of the window
+            if self.planned_intakers_view[first_hour] > 0:
+                next_plannable_time = first_hour
+            else:
+                next_plannable_time = _first_available_hour(
+                    self.planned_intakers, first_hour, last_hour
+                )
+            # If we couldn't find a slot within a week for one patient: plan this patient later,
+            # because we haven't scheduled the intakers yet, and stop planning altogether
+            # to avoid excessive computation
+            if next_plannable_time < 0:
+                self.not_planned_within_week_counter += 1
                 break
 
+            planned_cases.append((case_id, next_plannable_time))
+            # Decrease the available intakers at this time slot
+            self.planned_intakers_view[next_plannable_time] -= 1
+            # All earlier hours in the window are fully booked, so the next case can start
+            # looking at this hour (it may still have an intaker left)
+            first_hour = next_plannable_time
+
         # We don't replan already scheduled patients in this implementation
         # This could be extended to reschedule patients if needed
 
@@ -215,54 +376,18 @@ class HeuristicPlanner(Planner):
         start_night = simulation_time + 199  # Starts at 01:00
 
         # Get the weekday name for resource scheduling
-        week_day = str(Weekday(day_of_week))
-
-        # Get the required resources for each time slot from the weekly schedule
-        resources_next_morning = get_scheduled_resources(
-            week_day, start_morning, self.weekly_resource_schedule
-        )  # resources from 8-12
-        resources_next_afternoon = get_scheduled_resources(
-            week_day, start_afternoon, self.weekly_resource_schedule
-        )  # resources from 12-18
-        resources_next_evening = get_scheduled_resources(
-            week_day, start_evening, self.weekly_resource_schedule
-        )  # resources from 17-1
-        resources_next_night = get_scheduled_resources(
-            week_day, start_night, self.weekly_resource_schedule
-        )  # resources from 1-8
-
-        def format_resources():
-            """
-            Helper function to format resource schedules into the required tuple format.
-            Converts dictionary representations to (resource_type, time, count) tuples.
-            """
-            # Convert each time slot's resources into tuples
-            scheduled_resources_morning = [
-                (resource_type, start_morning, value)
-                for resource_type, value in resources_next_morning.items()
-            ]
-            scheduled_resources_afternoon = [
-                (resource_type, start_afternoon, value)
-                for resource_type, value in resources_next_afternoon.items()
-            ]
-            scheduled_resources_evening = [
-                (resource_type, start_evening, value)
-                for resource_type, value in resources_next_evening.items()
+        week_day = WEEKDAY_NAMES[int(day_of_week)]
+
+        # Get the required resources for each time slot from the weekly schedule and
+        # convert them into (resource_type, time, count) tuples
+        scheduled_resources = []
+        for start_time in (start_morning, start_afternoon, start_evening, start_night):
+            scheduled_resources += [
+                (resource_type, start_time, value)
+                for resource_type, value in self.get_slot_resources(
+                    week_day, start_time
+                )
             ]
-            scheduled_resources_night = [
-                (resource_type, start_night, value)
-                for resource_type, value in resources_next_night.items()
-            ]
-            # Combine all time slots into a single schedule
-            return (
-                scheduled_resources_morning
-                + scheduled_resources_afternoon
-                + scheduled_resources_evening
-                + scheduled_resources_night
-            )
-
-        # Get the formatted resource schedule
-        scheduled_resources = format_resources()
 
         # Update the intaker availability based on the new schedule
         self.update_intaker_schedule(scheduled_resources)
@@ -276,8 +401,8 @@ if __name__ == "__main__":
     of the heuristic planner with a specific resource schedule.
     """
 
-    # Use the first resource schedule from the predefined options
-    optimized_resource_schedule = regular_resource_allocation[0]
+    # Use the regular resource schedule
+    optimized_resource_schedule = regular_resource_allocation
 
     # Create the HeuristicPlanner and configure it with the optimized resource schedule
     planner = HeuristicPlanner(
@@ -288,6 +413,7 @@ if __name__ == "__main__":
 
     # Run a year-long simulation (365 days * 24 hours)
     result = simulator.run(365 * 24)
+    planner.eventlog_reporter.close()  # Write the remaining buffered events to disk
 
     # Calculate the cost using the weighted formula:
     # - Waiting time for admission contributes to patient dissatisfaction
@@ -304,9 +430,11 @@ if __name__ == "__main__":
 
     # Save the simulation results to a file in the "runs" directory
     os.makedirs("runs", exist_ok=True)  # Create the runs directory if it doesn't exist
-    i = len(os.listdir("runs")) + 1  # Get the next run number
-    print(f"Saving run as run {i}...")
-    with open(f"runs/run{i}.txt", "w") as file:
+    # Name the run after the current time (plus a random suffix) instead of counting the
+    # existing runs, so the directory does not have to be listed
+    run_name = f"run_{int(time.time())}_{uuid.uuid4().hex[:6]}"
+    print(f"Saving run as {run_name}...")
+    with open(f"runs/{run_name}.txt", "w") as file:
         file.write(f"Result: {result}\n")
         file.write(f"TOTAL COST = {cost}\n")
 
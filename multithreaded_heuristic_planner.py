@@ -10,47 +10,89 @@ The simulation focuses on optimizing resource allocation in a healthcare setting
 metrics like waiting times, patient nervousness, and personnel costs against baseline values.
 
 Usage:
-    ./multithread_run --processes N --days D --resource-index R
+    ./multithread_run --processes N --days D --resource-index R [--no-event-log]
 
 Where:
     N = Number of parallel simulations (default: 6)
     D = Number of days to simulate (default: 365)
     R = Index of resource schedule configuration to use (default: 0)
+    --no-event-log = Skip writing an event log for each simulation
 """
 import multiprocessing
 import os
 import json
-import statistics
 import argparse
 import sys
-from heuristic_planner import HeuristicPlanner
+import math
+import numpy as np
+from heuristic_planner import HeuristicPlanner, warm_up
 from simulator import Simulator
 from problems import HealthcareProblem
-from resource_logistics import regular_resource_allocation
+from resource_logistics import resource_allocations
 
-def run_planner(process_id, results_dict, resource_schedule_index=0, simulation_days=365):
+class RunningStatistics:
+    """
+    Statistics of a single KPI that are updated as simulation results come in.
+    
+    The mean and variance are updated with Welford's online algorithm, which needs a single
+    pass and stays numerically stable. The values themselves are kept as well, because the
+    median cannot be computed in a streaming fashion.
+    """
+    
+    def __init__(self):
+        self.values = []
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared differences from the current mean
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value):
+        """Add the value of one simulation run to the statistics."""
+        self.values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def summary(self):
+        """Return the mean, median, sample standard deviation, minimum and maximum as a dict."""
+        n = len(self.values)
+        return {
+            "mean": self.mean,
+            "median": float(np.median(self.values)),
+            "stdev": math.sqrt(self.m2 / (n - 1)) if n > 1 else 0,
+            "min": self.min,
+            "max": self.max
+        }
+
+def run_planner(process_id, resource_schedule_index=0, simulation_days=365, write_event_log=True):
     """
     Run a single instance of the heuristic planner in its own process.
     
     Each process simulates a healthcare environment for the specified number of days,
-    using a predetermined resource schedule. Results are collected in a shared dictionary
+    using a predetermined resource schedule. Results are returned to the main process
     for later aggregation and analysis.
     
     Args:
         process_id (int): Unique identifier for this simulation process
-        results_dict (dict): Shared dictionary to store simulation results
         resource_schedule_index (int): Index of resource schedule to use from predefined options
         simulation_days (int): Number of days to simulate (converted to hours internally)
+        write_event_log (bool): Whether this process writes an event log
+    
+    Returns:
+        dict: The simulation results, or a dict with an "error" key if the simulation failed
     
     Notes:
         - Each process writes its event log to a separate file to prevent I/O conflicts
-        - Results are written to individual files and also stored in the shared dictionary
+        - The resource schedule graph is never drawn here, so resource reporting is disabled
+        - Results are written to individual files and also returned to the main process
         - Cost metric is calculated with personnel costs weighted 3x to reflect their importance
     """
     try:
         # Select the resource schedule based on provided index
         # This allows testing different resource allocation strategies
-        optimized_resource_schedule = regular_resource_allocation[resource_schedule_index]
+        optimized_resource_schedule = resource_allocations[resource_schedule_index]
         
         # Create process-specific event log file to avoid concurrent access issues
         event_log_file = f"./temp/event_log_{process_id}.csv"
@@ -58,7 +100,11 @@ def run_planner(process_id, results_dict, resource_schedule_index=0, simulation_
         # Initialize planner with the resource schedule
         # The planner handles resource allocation and scheduling within the simulation
         planner = HeuristicPlanner(
-            event_log_file, ["diagnosis"], optimized_resource_schedule
+            event_log_file,
+            ["diagnosis"],
+            optimized_resource_schedule,
+            enable_eventlog=write_event_log,
+            enable_resource_reporter=False,
         )
         problem = HealthcareProblem()  # Defines the healthcare-specific simulation parameters
         simulator = Simulator(planner, problem)  # Combines the planner with the problem domain
@@ -66,6 +112,8 @@ def run_planner(process_id, results_dict, resource_schedule_index=0, simulation_
         # Run simulation for specified number of days (converted to hours)
         # The simulator tracks events at hourly intervals
         result = simulator.run(simulation_days * 24)
+        if planner.eventlog_reporter is not None:
+            planner.eventlog_reporter.close()  # Write the remaining buffered events to disk
         
         # Calculate cost metric with weighted components
         # Personnel costs are weighted more heavily (3x) as they represent the most
@@ -79,7 +127,6 @@ def run_planner(process_id, results_dict, resource_schedule_index=0, simulation_
         
         # Store calculated metrics in the results
         result["total_cost"] = cost
-        results_dict[process_id] = result  # Add to shared dictionary for later analysis
         
         # Write individual run results to separate files for detailed inspection if needed
         os.makedirs("runs", exist_ok=True)
@@ -88,10 +135,20 @@ def run_planner(process_id, results_dict, resource_schedule_index=0, simulation_
             file.write(f"TOTAL COST = {cost}\n")
             
         print(f"Process {process_id} completed successfully")
+        return result
     except Exception as e:
         # Robust error handling ensures one failed simulation doesn't affect others
         print(f"Error in process {process_id}: {str(e)}")
-        results_dict[process_id] = {"error": str(e)}  # Store error for analysis
+        return {"error": str(e)}  # Return error for analysis
+
+def run_planner_worker(planner_args):
+    """
+    Unpack a (process_id, resource_schedule_index, simulation_days, write_event_log) tuple and run the planner.
+    
+    Pool.imap_unordered passes a single argument to its function, so this wrapper
+    forwards the tuple to run_planner.
+    """
+    return run_planner(*planner_args)
 
 def main():
     """
@@ -115,6 +172,7 @@ def main():
     parser.add_argument('--processes', type=int, default=6, help='Number of parallel simulations to run')
     parser.add_argument('--days', type=int, default=365, help='Number of days to simulate')
     parser.add_argument('--resource-index', type=int, default=0, help='Index of resource schedule to use')
+    parser.add_argument('--no-event-log', action='store_true', help='Do not write an event log per simulation')
     args = parser.parse_args()
     
     # Create required directories for storing temporary and results data
@@ -122,44 +180,52 @@ def main():
     os.makedirs("./temp", exist_ok=True)
     os.makedirs("./runs", exist_ok=True)
     
-    # Initialize multiprocessing resources
-    # Manager provides a way to create data structures that can be shared between processes
-    manager = multiprocessing.Manager()
-    results_dict = manager.dict()  # Shared dictionary to collect results from all processes
-    processes = []
-    
     print(f"Starting {args.processes} planner instances simulating {args.days} days each...")
     print(f"Using resource schedule at index {args.resource_index}")
     
-    # Create and start processes
-    # Each process will run independently with its own interpreter and memory space (while resuing the same python interpreter)
-    python_interpreter_path = sys.executable
-    for i in range(args.processes):
-        process = multiprocessing.Process(
-            target=run_planner, 
-            args=(i, results_dict, args.resource_index, args.days)
-        )
-        process._config = {'python_executable': python_interpreter_path}  # Ensure the correct interpreter is used
-        processes.append(process)
-        process.start()
-    
-    # Wait for all processes to complete
-    for process in processes:
-        process.join()
+    # Make sure worker processes use the same python interpreter as this script
+    multiprocessing.set_executable(sys.executable)
     
-    # Convert the shared dict to a list
-    results = [results_dict[i] for i in range(args.processes) if i in results_dict]
+    # Do the one-time setup here, so that forked workers inherit it
+    # Workers also run it as pool initializer, which covers the spawn start method
+    # and keeps the setup out of the simulations themselves
+    warm_up()
     
-    # Filter out any failed runs
-    valid_results = [r for r in results if isinstance(r, dict) and "error" not in r]
+    # Run the simulations in a pool of worker processes
+    # Each worker returns its result through the pool's pipe once its simulation has finished,
+    # so no shared (Manager) dictionary is needed to collect the results
+    planner_args = [
+        (i, args.resource_index, args.days, not args.no_event_log) for i in range(args.processes)
+    ]
+    # Statistics per KPI, folded in as soon as a simulation finishes
+    # KPIs with non-numeric values are marked with None
+    kpi_statistics = {}
+    completed_runs = 0
+    with multiprocessing.Pool(args.processes, initializer=warm_up) as pool:
+        for result in pool.imap_unordered(run_planner_worker, planner_args):
+            # Skip failed runs
+            if not isinstance(result, dict) or "error" in result:
+                continue
+            completed_runs += 1
+            for key, value in result.items():
+                if key not in kpi_statistics:
+                    kpi_statistics[key] = RunningStatistics()
+                if kpi_statistics[key] is not None and isinstance(value, (int, float)):
+                    kpi_statistics[key].add(value)
+                else:
+                    kpi_statistics[key] = None
+            if kpi_statistics.get("total_cost") is not None:
+                print(
+                    f"{completed_runs}/{args.processes} simulations completed, "
+                    f"running mean total cost: {kpi_statistics['total_cost'].mean:.2f}"
+                )
     
-    if not valid_results:
+    if completed_runs == 0:
         print("All simulation runs failed. Check the error logs.")
         return
     
-    print(f"Completed {len(valid_results)} successful simulations. Calculating statistics...")
+    print(f"Completed {completed_runs} successful simulations. Calculating statistics...")
     
-    # Rest of the function remains the same
     # Define baseline averages
     baseline_values = {
         "waiting_time_for_admission": 286588.8,
@@ -175,20 +241,11 @@ def main():
         + baseline_values["personnel_cost"] * 3
     )
     
-    # Calculate statistics for each metric
+    # Summarize the statistics for each metric
     aggregated_results = {}
-    for key in valid_results[0].keys():
-        values = [result[key] for result in valid_results]
-        
-        # Check if values are numeric before calculating statistics
-        if all(isinstance(val, (int, float)) for val in values):
-            aggregated_results[key] = {
-                "mean": statistics.mean(values),
-                "median": statistics.median(values),
-                "stdev": statistics.stdev(values) if len(values) > 1 else 0,
-                "min": min(values),
-                "max": max(values)
-            }
+    for key, kpi_stats in kpi_statistics.items():
+        if kpi_stats is not None:
+            aggregated_results[key] = kpi_stats.summary()
             
             # Add comparison to baseline if available
             if key in baseline_values:
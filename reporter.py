@@ -46,8 +46,11 @@ class EventLogReporter(Reporter):
     This class is used to log the events of the simulation in a CSV file that can be read in a process mining tool.
     The CSV file has a header with the following columns: case_id, task_id, event_label, resource, start_time, completion_time, data_type1, data_type2, ...
     The constructor takes two arguments: the filename of the CSV file and a list of data types that will be logged in the CSV file.
+    Rows are written through a large buffer instead of being flushed one by one, so close() must be called to make sure all rows end up in the file.
     """
 
+    BUFFER_SIZE = 1 << 20  # 1 MiB
+
     def __init__(self, filename, data_types):
         super().__init__()
         self.task_start_times = dict()
@@ -56,7 +59,7 @@ class EventLogReporter(Reporter):
         dirname = os.path.dirname(filename)
         if not os.path.exists(dirname):
             os.makedirs(dirname)
-        self.logfile = open(filename, "wt")
+        self.logfile = open(filename, "wt", buffering=self.BUFFER_SIZE)
         self.logfile.write(
             "case_id,task_id,event_label,resource,start_time,completion_time"
         )
@@ -81,20 +84,20 @@ class EventLogReporter(Reporter):
                 del self.task_start_times[(case_id, element.label)]
             else:
                 start_time = completion_time
-            resource = resource
-            self.logfile.write(str(case_id) + ",")
-            self.logfile.write(str(element.id) + ",")
-            self.logfile.write(element.label + ",")
-            self.logfile.write(str(resource) + ",")
-            self.logfile.write(start_time + ",")
-            self.logfile.write(completion_time)
+            row = [
+                str(case_id),
+                str(element.id),
+                element.label,
+                str(resource),
+                start_time,
+                completion_time,
+            ]
             for data_type in self.data_types:
                 if data_type in element.data:
-                    self.logfile.write("," + str(element.data[data_type]))
+                    row.append(str(element.data[data_type]))
                 else:
-                    self.logfile.write(",")
-            self.logfile.write("\n")
-            self.logfile.flush()
+                    row.append("")
+            self.logfile.write(",".join(row) + "\n")
 
     def close(self):
         self.logfile.close()
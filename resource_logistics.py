@@ -14,8 +14,52 @@ taking into account factors such as:
 """
 
 import math
+import numbers
+import sys
+from types import MappingProxyType
 import numpy as np
-from dutch_holidays import check_if_holiday
+from dutch_holidays import check_if_holiday, check_if_holiday_batch
+
+# Time slot of every hour of the day, so that get_time_slot is a single index.
+# The slot names are interned, so dictionary lookups with them can compare by identity.
+_NIGHT, _MORNING, _AFTERNOON, _EVENING = (
+    sys.intern(time_slot) for time_slot in ("01-08", "08-12", "12-18", "18-01")
+)
+TIME_SLOT_BY_HOUR = (
+    (_EVENING,)  # 0: the evening shift runs until 1am
+    + (_NIGHT,) * 7  # 1-7
+    + (_MORNING,) * 4  # 8-11
+    + (_AFTERNOON,) * 6  # 12-17
+    + (_EVENING,) * 6  # 18-23
+)
+
+# Time slots in the order of the time slot axis of allocation_to_array, and the index of
+# the time slot of every hour of the day
+TIME_SLOTS = (_NIGHT, _MORNING, _AFTERNOON, _EVENING)
+SLOT_INDEX_BY_HOUR = np.array([TIME_SLOTS.index(slot) for slot in TIME_SLOT_BY_HOUR])
+
+# How every resource type of the base allocation is scheduled, in the order of the resource
+# axis of the schedule arrays. On holidays the base amount is multiplied by the holiday
+# factor numerator / denominator, and raised to the holiday minimum; the result is capped at
+# the capacity. The multiplication is done with integers only: the rounding offset is added
+# before the floor division, so an offset of denominator - 1 rounds up and an offset of
+# denominator // 2 rounds to the nearest integer.
+# (resource_type, holiday_numerator, holiday_denominator, holiday_rounding_offset,
+#  holiday_minimum, capacity)
+RESOURCE_POLICIES = (
+    # Operating rooms are reduced by 50% (rounded up) on holidays, with minimum of 1 (max 5)
+    ("OR", 1, 2, 1, 1, 5),
+    # A-type beds are reduced by 20% on holidays (max 30)
+    ("A_BED", 4, 5, 2, 0, 30),
+    # B-type beds are reduced by 20% on holidays (max 40)
+    ("B_BED", 4, 5, 2, 0, 40),
+    # On holidays, only 1 intake resource is scheduled (max 4)
+    ("INTAKE", 0, 1, 0, 1, 4),
+)
+# Like the time slots, the resource type names are interned
+RESOURCE_TYPES = tuple(sys.intern(policy[0]) for policy in RESOURCE_POLICIES)
+RESOURCE_POLICY_BY_TYPE = {policy[0]: policy for policy in RESOURCE_POLICIES}
+RESOURCE_CAPACITY = np.array([policy[5] for policy in RESOURCE_POLICIES])
 
 
 def get_time_slot(hour_in_simulation: int) -> str:
@@ -34,39 +78,184 @@ def get_time_slot(hour_in_simulation: int) -> str:
     Returns:
         str: Time slot identifier ("01-08", "08-12", "12-18", or "18-01")
     """
-    # Convert simulation hours to hour of the day (0-23)
-    hour_in_day = hour_in_simulation % 24
-
-    # Determine time slot based on hour of day
-    if hour_in_day >= 1 and hour_in_day < 8:
-        return "01-08"
-    elif hour_in_day >= 8 and hour_in_day < 12:
-        return "08-12"
-    elif hour_in_day >= 12 and hour_in_day < 18:
-        return "12-18"
-    else:
-        # This covers both 0 and 18-23 hours (6pm to 1am)
-        return "18-01"
+    # Convert simulation hours to hour of the day (0-23) and look up its time slot
+    return TIME_SLOT_BY_HOUR[int(hour_in_simulation % 24)]
 
 
-def get_scheduled_resources(day_of_week: str, hour: int, regular_resource_allocation):
+def get_scheduled_resources(
+    day_of_week: str, hour: int, regular_resource_allocation: dict
+) -> dict:
     """
-    Calculate the number of resources to schedule based on time, day, and holiday status.
+    Get the number of resources to schedule based on time, day, and holiday status.
+
+    The resources are determined by:
+    1. Retrieving the base resource values of the time slot of the hour
+    2. Adjusting for holidays and enforcing the maximum capacity (see get_resource_amount)
+    3. Adding the ER practitioners, which follow their own schedule
 
-    This function determines optimal resource allocation by:
-    1. Identifying the appropriate time slot for the given hour
-    2. Retrieving base resource values for that day and time slot
-    3. Adjusting for holidays by reducing certain resources
-    4. Enforcing maximum capacity constraints for each resource type
+    The allocation is read on every call, so changes to it are picked up immediately. To
+    look up many hours, build a table once with build_schedule_table (as HeuristicPlanner
+    does) or use get_scheduled_resources_batch.
 
     Parameters:
         day_of_week (str): Day of the week (e.g., "Monday", "Tuesday")
-        hour (int): Current hour in simulation
+        hour (int or float): Current hour in simulation
         regular_resource_allocation (dict): Dictionary containing base resource allocation values
                                   by day and time slot
 
     Returns:
         dict: Scheduled resource counts for each resource type
+    """
+    slot_allocation = regular_resource_allocation[day_of_week][get_time_slot(hour)]
+    isHoliday = check_if_holiday(hour)
+    scheduled = {}
+    for resource_type, amount in slot_allocation.items():
+        scheduled[resource_type] = get_resource_amount(resource_type, amount, isHoliday)
+    scheduled["ER_PRACTITIONER"] = get_er_practitioner_amount(hour, isHoliday)
+    return scheduled
+
+
+def get_resource_amount(resource_type: str, amount: int, isHoliday: bool) -> int:
+    """
+    Apply the holiday policy and the capacity of a resource type (see RESOURCE_POLICIES)
+    to its base amount. This is the scalar version of steps 2 and 3 of build_schedule_array.
+
+    Parameters:
+        resource_type (str): Resource type of the amount (e.g., "OR")
+        amount (int): Base amount from the resource allocation
+        isHoliday (bool): Whether the current day is a holiday
+
+    Returns:
+        int: Number of resources of this type to schedule
+    """
+    check_resource_amount(resource_type, amount)
+    _, numerator, denominator, rounding_offset, minimum, capacity = (
+        RESOURCE_POLICY_BY_TYPE[resource_type]
+    )
+    if isHoliday:
+        amount = max(minimum, (amount * numerator + rounding_offset) // denominator)
+    return min(amount, capacity)
+
+
+def check_resource_amount(resource_type, amount):
+    """
+    Check that an entry of a resource allocation can be scheduled.
+
+    The holiday policies use integer arithmetic and the schedule arrays hold integers, so
+    amounts must be non-negative integers.
+
+    Parameters:
+        resource_type (str): Resource type of the entry
+        amount: Base amount of the entry
+
+    Raises:
+        ValueError: If the resource type is unknown or the amount is not a non-negative integer
+    """
+    if resource_type not in RESOURCE_POLICY_BY_TYPE:
+        # Raise error for unknown resource types to prevent silent failures
+        raise ValueError(
+            "An unknown resource type has been given in get_scheduled_resources in resource_logistics.py"
+        )
+    if not isinstance(amount, numbers.Integral) or amount < 0:
+        # Raise error for fractional or negative amounts instead of silently truncating them
+        raise ValueError(
+            f"The amount of {resource_type} must be a non-negative integer, got {amount!r}"
+        )
+
+
+def get_scheduled_resources_batch(days_of_week, hours, regular_resource_allocation):
+    """
+    Get the number of resources to schedule for many (day, hour) pairs at once.
+
+    This is the vectorized counterpart of get_scheduled_resources: instead of one dict per
+    hour it returns one array per resource type, gathered from the dense schedule array
+    (see build_schedule_array) in a single NumPy indexing operation. The array is built
+    from the allocation on every call.
+
+    Parameters:
+        days_of_week (array-like of str): Day of the week for every hour (e.g., "Monday")
+        hours (array-like of int): Hours in simulation, same length as days_of_week
+        regular_resource_allocation (dict): Dictionary containing base resource allocation values
+                                  by day and time slot
+
+    Returns:
+        dict: Maps each resource type to an int8 array with the scheduled count per hour.
+            Where the time slot of an hour does not list a resource type, and
+            get_scheduled_resources would leave it out, its count is 0.
+    """
+    day_names, resource_types, schedule_array = build_schedule_array(
+        regular_resource_allocation
+    )
+    hours = np.asarray(hours, dtype=np.intp)
+    # Convert the day names to indices, looking up every distinct name only once
+    unique_days, day_positions = np.unique(
+        np.asarray(days_of_week), return_inverse=True
+    )
+    day_indices = np.array(
+        [day_names.index(day_of_week) for day_of_week in unique_days], dtype=np.intp
+    )[day_positions]
+
+    scheduled = schedule_array[
+        day_indices, hours % 24, check_if_holiday_batch(hours).astype(np.intp)
+    ]
+    return {
+        resource_type: scheduled[..., i]
+        for i, resource_type in enumerate(resource_types)
+    }
+
+
+def build_schedule_table(regular_resource_allocation: dict) -> dict:
+    """
+    Convert the schedule array of an allocation into a dict for every (day, hour of day,
+    holiday) combination. The resource types of each dict are in the order in which the
+    allocation lists them, followed by ER_PRACTITIONER. The dicts are shared by every lookup,
+    so they are wrapped in read-only views.
+
+    The table reflects the allocation at the time it is built; later changes to the
+    allocation require building a new table.
+    """
+    day_names, resource_types, schedule_array = build_schedule_array(
+        regular_resource_allocation
+    )
+    schedule_table = {}
+    for day_index, day_of_week in enumerate(day_names):
+        for hour_of_day in range(24):
+            time_slot = TIME_SLOT_BY_HOUR[hour_of_day]
+            slot_resource_types = list(
+                regular_resource_allocation[day_of_week][time_slot]
+            ) + ["ER_PRACTITIONER"]
+            for isHoliday in (False, True):
+                scheduled = schedule_array[day_index, hour_of_day, int(isHoliday)]
+                scheduled_resources = {
+                    resource_type: int(scheduled[resource_types.index(resource_type)])
+                    for resource_type in slot_resource_types
+                }
+                schedule_table[(day_of_week, hour_of_day, isHoliday)] = (
+                    MappingProxyType(scheduled_resources)
+                )
+    return schedule_table
+
+
+def build_schedule_array(regular_resource_allocation):
+    """
+    Calculate the number of resources to schedule for every day, hour of the day and holiday status.
+
+    The resources are determined by:
+    1. Retrieving the base resource values of the time slot of every hour of the day
+    2. Adjusting for holidays by reducing certain resources
+    3. Enforcing maximum capacity constraints for each resource type
+    4. Adding the ER practitioners, which follow their own schedule
+
+    Each step is applied to all days and hours at once. Resource types that a time slot
+    does not list are not scheduled in it, so their count is 0 (also on holidays).
+
+    Parameters:
+        regular_resource_allocation (dict): Dictionary containing base resource allocation values
+                                  by day and time slot
+
+    Returns:
+        tuple: (day_names, resource_types, schedule_array), where schedule_array is an int8
+            array indexed by [day index, hour of day, isHoliday, resource index]
 
     Notes:
         Resource types include:
@@ -76,56 +265,92 @@ def get_scheduled_resources(day_of_week: str, hour: int, regular_resource_alloca
         - INTAKE: Intake capacity (max 4)
         - ER_PRACTITIONER: Emergency practitioners (max 9)
     """
-    # 1. Get the time slot of the hour that we will have to schedule.
-    time_slot = get_time_slot(hour)
+    # 1. Get the base values for every hour of the day, indexed by [day, hour of day, resource]
+    day_names, base, listed = allocation_to_array(regular_resource_allocation)
+    regular = base[:, SLOT_INDEX_BY_HOUR, :]
 
-    # 2. Get the corresponding values for number of resources from the resource_allocation dictionary
-    regular_resource_allocation = regular_resource_allocation[day_of_week][time_slot]
+    # 2. Adjust the resources for holidays, following the policy of each resource type
+    holiday = np.empty_like(regular)
+    for index, policy in enumerate(RESOURCE_POLICIES):
+        _, numerator, denominator, rounding_offset, minimum, _ = policy
+        holiday[..., index] = np.maximum(
+            minimum, (regular[..., index] * numerator + rounding_offset) // denominator
+        )
 
-    # 3. Check if the current hour falls on a holiday to adjust resource allocation
-    isHoliday = check_if_holiday(hour)
+    # 3. Enforce the maximum capacity of each resource type, and drop the resource types
+    # that the time slot does not list (the holiday minimum would otherwise add them)
+    amounts = np.minimum(np.stack([regular, holiday], axis=2), RESOURCE_CAPACITY)
+    amounts *= listed[:, SLOT_INDEX_BY_HOUR, np.newaxis, :]
 
-    # 4. Put resources in the scheduled dictionary and take into account the maximum capacity limits
-    # Each resource type has specific handling logic and capacity constraints
-    scheduled = {}
-    for resource_type, amount in regular_resource_allocation.items():
-        if resource_type == "OR":
-            # Operating rooms are reduced by 50% on holidays, with minimum of 1
-            if isHoliday:
-                amount = max(1, int(math.ceil(amount * 0.5)))
-            # Enforce maximum capacity of 5 ORs
-            scheduled[resource_type] = min(amount, 5)
-        elif resource_type == "A_BED":
-            # A-type beds are reduced by 20% on holidays
-            if isHoliday:
-                amount = int(round(amount * 0.8))
-            # Enforce maximum capacity of 30 A-type beds
-            scheduled[resource_type] = min(amount, 30)
-        elif resource_type == "B_BED":
-            # B-type beds are reduced by 20% on holidays
-            if isHoliday:
-                amount = int(round(amount * 0.8))
-            # Enforce maximum capacity of 40 B-type beds
-            scheduled[resource_type] = min(amount, 40)
-        elif resource_type == "INTAKE":
-            # On holidays, only 1 intake resource is scheduled
-            if isHoliday:
-                amount = 1
-            # Enforce maximum capacity of 4 intake resources
-            scheduled[resource_type] = min(amount, 4)
-        else:
-            # Raise error for unknown resource types to prevent silent failures
-            raise ValueError(
-                "An unknown resource type has been given in get_scheduled_resources in resource_logistics.py"
-            )
+    # 4. Add the ER practitioners, which only depend on the hour of the day and holiday status
+    resource_types = RESOURCE_TYPES + ("ER_PRACTITIONER",)
+    schedule_array = np.empty(
+        (len(day_names), 24, 2, len(resource_types)), dtype=np.int8
+    )
+    schedule_array[..., :-1] = amounts
+    schedule_array[..., -1] = np.array(ER_PRACTITIONER_TABLE).T
+    return day_names, resource_types, schedule_array
 
-    # ER practitioners are calculated separately due to more complex scheduling patterns
-    scheduled["ER_PRACTITIONER"] = get_er_practitioner_amount(hour, isHoliday)
 
-    return scheduled
+def allocation_to_array(regular_resource_allocation):
+    """
+    Convert the nested dictionaries of a resource allocation into a dense array.
+
+    Parameters:
+        regular_resource_allocation (dict): Dictionary containing base resource allocation values
+                                  by day and time slot
+
+    Returns:
+        tuple: (day_names, base, listed), where base is an array indexed by [day index, time
+            slot index, resource index] following the order of the allocation, TIME_SLOTS and
+            RESOURCE_TYPES, and listed is a boolean array of the same shape that tells which
+            resource types the time slot lists
+
+    Raises:
+        ValueError: If an entry of the allocation cannot be scheduled (see
+            check_resource_amount)
+    """
+    day_names = tuple(regular_resource_allocation)
+    base = np.zeros(
+        (len(day_names), len(TIME_SLOTS), len(RESOURCE_TYPES)), dtype=np.int64
+    )
+    listed = np.zeros(base.shape, dtype=bool)
+    for day_index, day_of_week in enumerate(day_names):
+        for slot_index, time_slot in enumerate(TIME_SLOTS):
+            slot_allocation = regular_resource_allocation[day_of_week][time_slot]
+            for resource_type, amount in slot_allocation.items():
+                check_resource_amount(resource_type, amount)
+                resource_index = RESOURCE_TYPES.index(resource_type)
+                base[day_index, slot_index, resource_index] = amount
+                listed[day_index, slot_index, resource_index] = True
+    return day_names, base, listed
 
 
-def get_er_practitioner_amount(hour, isHoliday):
+def get_er_practitioner_amount(hour: int, isHoliday: bool) -> int:
+    """
+    Get the number of ER practitioners to schedule based on time of day and holiday status.
+
+    The amount only depends on the hour of the day and the holiday status, so for whole
+    hours it is looked up in ER_PRACTITIONER_TABLE (see calculate_er_practitioner_amount
+    for the rules). Fractional hours are calculated instead.
+
+    Parameters:
+        hour (int or float): Current hour in simulation
+        isHoliday (bool): Whether the current day is a holiday
+
+    Returns:
+        int: Number of ER practitioners to schedule (between 2 and 9)
+    """
+    try:
+        return ER_PRACTITIONER_TABLE[isHoliday][hour % 24]
+    except TypeError:
+        # Float hours cannot index the table
+        if hour == int(hour):
+            return ER_PRACTITIONER_TABLE[isHoliday][int(hour) % 24]
+        return calculate_er_practitioner_amount(hour, isHoliday)
+
+
+def calculate_er_practitioner_amount(hour: int, isHoliday: bool) -> int:
     """
     Calculate the optimal number of ER practitioners based on time of day and holiday status.
 
@@ -150,10 +375,10 @@ def get_er_practitioner_amount(hour, isHoliday):
         if isHoliday:
             # Holidays have significantly higher ER demand in evenings
             # Formula derived from historical data analysis in Excel
-            amount = 0.9243 * np.exp(0.3888 * hour_of_day) * 2
+            amount = 0.9243 * math.exp(0.3888 * hour_of_day) * 2
         else:
             # Regular evenings still see exponential increase but less steep
-            amount = 0.8879 * np.exp(0.2757 * hour_of_day) * 2
+            amount = 0.8879 * math.exp(0.2757 * hour_of_day) * 2
     elif hour_of_day >= 0 and hour_of_day <= 2.5:
         if isHoliday:
             # Early morning hours after holiday nights are peak demand
@@ -175,52 +400,66 @@ def get_er_practitioner_amount(hour, isHoliday):
     return min(amount, 9)
 
 
+# Number of ER practitioners indexed by [isHoliday][hour of day], calculated once at import.
+# Nested tuples of ints are used because indexing them from Python is several times
+# cheaper than indexing an ndarray and converting the NumPy scalar back to an int.
+ER_PRACTITIONER_TABLE = tuple(
+    tuple(
+        calculate_er_practitioner_amount(hour_of_day, isHoliday)
+        for hour_of_day in range(24)
+    )
+    for isHoliday in (False, True)
+)
+
+
 # Resource estimates for different days and time slots
 # These values represent the baseline resource requirements before
-# adjustments for holidays and capacity constraints
-regular_resource_allocation = [
-    {  # model based on average resource usage from historical data
-        "Monday": {
-            "08-12": {"A_BED": 17, "B_BED": 40, "INTAKE": 4, "OR": 2},
-            "12-18": {"A_BED": 21, "B_BED": 39, "INTAKE": 4, "OR": 5},
-            "18-01": {"A_BED": 24, "B_BED": 40, "INTAKE": 2, "OR": 3},
-            "01-08": {"A_BED": 21, "B_BED": 39, "INTAKE": 2, "OR": 2},
-        },
-        "Tuesday": {
-            "08-12": {"A_BED": 23, "B_BED": 40, "INTAKE": 4, "OR": 2},
-            "12-18": {"A_BED": 25, "B_BED": 40, "INTAKE": 4, "OR": 5},
-            "18-01": {"A_BED": 26, "B_BED": 40, "INTAKE": 3, "OR": 3},
-            "01-08": {"A_BED": 25, "B_BED": 39, "INTAKE": 4, "OR": 2},
-        },
-        "Wednesday": {
-            "08-12": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
-            "12-18": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 5},
-            "18-01": {"A_BED": 26, "B_BED": 40, "INTAKE": 2, "OR": 3},
-            "01-08": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
-        },
-        "Thursday": {
-            "08-12": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
-            "12-18": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 5},
-            "18-01": {"A_BED": 26, "B_BED": 40, "INTAKE": 2, "OR": 4},
-            "01-08": {"A_BED": 26, "B_BED": 40, "INTAKE": 4, "OR": 2},
-        },
-        "Friday": {
-            "08-12": {"A_BED": 26, "B_BED": 40, "INTAKE": 4, "OR": 2},
-            "12-18": {"A_BED": 23, "B_BED": 40, "INTAKE": 1, "OR": 1},
-            "18-01": {"A_BED": 21, "B_BED": 40, "INTAKE": 1, "OR": 1},
-            "01-08": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
-        },
-        "Saturday": {
-            "08-12": {"A_BED": 16, "B_BED": 40, "OR": 1, "INTAKE": 4},
-            "12-18": {"A_BED": 13, "B_BED": 40, "OR": 1, "INTAKE": 4},
-            "18-01": {"A_BED": 13, "B_BED": 40, "OR": 1, "INTAKE": 2},
-            "01-08": {"A_BED": 20, "B_BED": 40, "OR": 2, "INTAKE": 2},
-        },
-        "Sunday": {
-            "08-12": {"A_BED": 9, "B_BED": 40, "INTAKE": 4, "OR": 2},
-            "12-18": {"A_BED": 14, "B_BED": 39, "INTAKE": 4, "OR": 5},
-            "18-01": {"A_BED": 18, "B_BED": 40, "INTAKE": 2, "OR": 3},
-            "01-08": {"A_BED": 13, "B_BED": 40, "INTAKE": 2, "OR": 2},
-        },
-    }
-]
+# adjustments for holidays and capacity constraints.
+# The model is based on average resource usage from historical data.
+regular_resource_allocation = {
+    "Monday": {
+        "08-12": {"A_BED": 17, "B_BED": 40, "INTAKE": 4, "OR": 2},
+        "12-18": {"A_BED": 21, "B_BED": 39, "INTAKE": 4, "OR": 5},
+        "18-01": {"A_BED": 24, "B_BED": 40, "INTAKE": 2, "OR": 3},
+        "01-08": {"A_BED": 21, "B_BED": 39, "INTAKE": 2, "OR": 2},
+    },
+    "Tuesday": {
+        "08-12": {"A_BED": 23, "B_BED": 40, "INTAKE": 4, "OR": 2},
+        "12-18": {"A_BED": 25, "B_BED": 40, "INTAKE": 4, "OR": 5},
+        "18-01": {"A_BED": 26, "B_BED": 40, "INTAKE": 3, "OR": 3},
+        "01-08": {"A_BED": 25, "B_BED": 39, "INTAKE": 4, "OR": 2},
+    },
+    "Wednesday": {
+        "08-12": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
+        "12-18": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 5},
+        "18-01": {"A_BED": 26, "B_BED": 40, "INTAKE": 2, "OR": 3},
+        "01-08": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
+    },
+    "Thursday": {
+        "08-12": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
+        "12-18": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 5},
+        "18-01": {"A_BED": 26, "B_BED": 40, "INTAKE": 2, "OR": 4},
+        "01-08": {"A_BED": 26, "B_BED": 40, "INTAKE": 4, "OR": 2},
+    },
+    "Friday": {
+        "08-12": {"A_BED": 26, "B_BED": 40, "INTAKE": 4, "OR": 2},
+        "12-18": {"A_BED": 23, "B_BED": 40, "INTAKE": 1, "OR": 1},
+        "18-01": {"A_BED": 21, "B_BED": 40, "INTAKE": 1, "OR": 1},
+        "01-08": {"A_BED": 27, "B_BED": 40, "INTAKE": 4, "OR": 2},
+    },
+    "Saturday": {
+        "08-12": {"A_BED": 16, "B_BED": 40, "OR": 1, "INTAKE": 4},
+        "12-18": {"A_BED": 13, "B_BED": 40, "OR": 1, "INTAKE": 4},
+        "18-01": {"A_BED": 13, "B_BED": 40, "OR": 1, "INTAKE": 2},
+        "01-08": {"A_BED": 20, "B_BED": 40, "OR": 2, "INTAKE": 2},
+    },
+    "Sunday": {
+        "08-12": {"A_BED": 9, "B_BED": 40, "INTAKE": 4, "OR": 2},
+        "12-18": {"A_BED": 14, "B_BED": 39, "INTAKE": 4, "OR": 5},
+        "18-01": {"A_BED": 18, "B_BED": 40, "INTAKE": 2, "OR": 3},
+        "01-08": {"A_BED": 13, "B_BED": 40, "INTAKE": 2, "OR": 2},
+    },
+}
+
+# All resource allocations that can be selected by index (see multithreaded_heuristic_planner.py)
+resource_allocations = [regular_resource_allocation]